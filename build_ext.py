@@ -0,0 +1,45 @@
+"""Сборка AOT-модуля training_kernels с ядрами калорий.
+
+Запуск: python build_ext.py
+
+Готовый модуль импортируется как обычное C-расширение, поэтому
+homework.py стартует без JIT-компиляции и прогрева Numba.
+"""
+from numba.pycc import CC
+
+from homework import _RUN_DURATION_FACTOR, _WALK_SPEED_HEIGHT_FACTOR
+
+cc = CC("training_kernels")
+
+
+@cc.export("run_cal", "f8(f8, f8, f8)")
+def run_cal(mean_speed: float, duration: float, weight: float) -> float:
+    """Калории бега по заранее посчитанной средней скорости."""
+    return (
+        (18.0 * mean_speed + 1.79) * weight * duration * _RUN_DURATION_FACTOR
+    )
+
+
+@cc.export("walk_cal", "f8(f8, f8, f8, f8)")
+def walk_cal(
+    mean_speed: float,
+    duration: float,
+    weight: float,
+    height: float
+) -> float:
+    """Калории спортивной ходьбы."""
+    return (
+        (0.035 * weight
+         + mean_speed**2 * _WALK_SPEED_HEIGHT_FACTOR / height * weight)
+        * duration * 60.0
+    )
+
+
+@cc.export("swim_cal", "f8(f8, f8, f8)")
+def swim_cal(mean_speed: float, duration: float, weight: float) -> float:
+    """Калории плавания."""
+    return (mean_speed + 1.1) * 2.0 * weight * duration
+
+
+if __name__ == "__main__":
+    cc.compile()
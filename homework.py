@@ -1,8 +1,75 @@
-from dataclasses import asdict, dataclass
-from typing import ClassVar, Dict, List, Type
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import ClassVar
 
+import numpy as np
+from numba import float64, njit, prange
 
-@dataclass
+_RUN_DURATION_FACTOR = 60.0 / 1000.0
+_WALK_SPEED_HEIGHT_FACTOR = 0.278**2 * 0.029 * 100.0
+
+_MESSAGE_FIELDS = (
+    ("Тип тренировки: ", "training_type", ""),
+    ("; Длительность: ", "duration", ":.3f"),
+    (" ч.; Дистанция: ", "distance", ":.3f"),
+    (" км; Ср. скорость: ", "speed", ":.3f"),
+    (" км/ч; Потрачено ккал: ", "calories", ":.3f")
+)
+_MESSAGE_TEMPLATE = "".join(
+    f"{label}{{{spec}}}" for label, _, spec in _MESSAGE_FIELDS
+) + "."
+_FORMAT_MESSAGE = _MESSAGE_TEMPLATE.format
+
+
+try:
+    from kernels import run_cal as _run_cal
+    from kernels import swim_cal as _swim_cal
+    from kernels import walk_cal as _walk_cal
+except ImportError:
+    try:
+        from training_kernels import run_cal as _run_cal
+        from training_kernels import swim_cal as _swim_cal
+        from training_kernels import walk_cal as _walk_cal
+    except ImportError:
+        @njit(float64(float64, float64, float64), cache=True)
+        def _run_cal(
+            mean_speed: float,
+            duration: float,
+            weight: float
+        ) -> float:
+            """Скалярное ядро калорий бега, компилируется Numba на лету."""
+            return (
+                (18.0 * mean_speed + 1.79)
+                * weight * duration * _RUN_DURATION_FACTOR
+            )
+
+        @njit(float64(float64, float64, float64, float64), cache=True)
+        def _walk_cal(
+            mean_speed: float,
+            duration: float,
+            weight: float,
+            height: float
+        ) -> float:
+            """Скалярное ядро калорий спортивной ходьбы."""
+            return (
+                (0.035 * weight
+                 + mean_speed**2 * _WALK_SPEED_HEIGHT_FACTOR / height
+                 * weight)
+                * duration * 60.0
+            )
+
+        @njit(float64(float64, float64, float64), cache=True)
+        def _swim_cal(
+            mean_speed: float,
+            duration: float,
+            weight: float
+        ) -> float:
+            """Скалярное ядро калорий плавания."""
+            return (mean_speed + 1.1) * 2.0 * weight * duration
+
+
+@dataclass(slots=True)
 class InfoMessage:
     """Информационное сообщение о тренировке."""
     training_type: str
@@ -11,19 +78,28 @@ class InfoMessage:
     speed: float
     calories: float
 
-    MESSAGE_TEMPLATE: ClassVar[str] = (
-        "Тип тренировки: {training_type}; "
-        "Длительность: {duration:.3f} ч.; "
-        "Дистанция: {distance:.3f} км; "
-        "Ср. скорость: {speed:.3f} км/ч; "
-        "Потрачено ккал: {calories:.3f}."
-    )
 
-    def get_message(self) -> str:
-        return self.MESSAGE_TEMPLATE.format(**asdict(self))
+def _compile_get_message(message_class: type) -> None:
+    """Сгенерировать специализированный get_message по описанию полей.
 
+    Из _MESSAGE_FIELDS собирается исходник метода с f-строкой,
+    читающей слоты напрямую, и компилируется через exec - байткод
+    получается тем же, что у f-строки, написанной вручную.
+    """
+    body = "".join(
+        f"{label}{{self.{field}{spec}}}"
+        for label, field, spec in _MESSAGE_FIELDS
+    ) + "."
+    source = f"def get_message(self) -> str:\n    return f{body!r}\n"
+    namespace: dict = {}
+    exec(source, namespace)
+    message_class.get_message = namespace["get_message"]
 
-@dataclass
+
+_compile_get_message(InfoMessage)
+
+
+@dataclass(eq=False, repr=False)
 class Training:
     """Базовый класс тренировки."""
     action: int
@@ -33,6 +109,11 @@ class Training:
     MINS_IN_HOUR: ClassVar[int] = 60
     LEN_STEP: ClassVar[float] = 0.65
     M_IN_KM: ClassVar[int] = 1000
+    _TYPE_NAME: ClassVar[str] = "Training"
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._TYPE_NAME = cls.__name__
 
     def get_distance(self) -> float:
         """Получить дистанцию в км."""
@@ -49,32 +130,36 @@ class Training:
             f"{type(self).__name__}"
         )
 
+    def _spent_calories(self, mean_speed: float) -> float:
+        """Калории по заранее посчитанной средней скорости."""
+        return self.get_spent_calories()
+
     def show_training_info(self) -> InfoMessage:
         """Вернуть информационное сообщение о выполненной тренировке."""
+        mean_speed = self.get_mean_speed()
         return InfoMessage(
-            type(self).__name__,
+            self._TYPE_NAME,
             self.duration,
             self.get_distance(),
-            self.get_mean_speed(),
-            self.get_spent_calories()
+            mean_speed,
+            self._spent_calories(mean_speed)
         )
 
 
-@dataclass
+@dataclass(eq=False, repr=False)
 class Running(Training):
     """Тренировка: бег."""
     CALORIES_MEAN_SPEED_MULTIPLIER: ClassVar[int] = 18
     CALORIES_MEAN_SPEED_SHIFT: ClassVar[float] = 1.79
 
     def get_spent_calories(self) -> float:
-        return (
-            (self.CALORIES_MEAN_SPEED_MULTIPLIER * self.get_mean_speed()
-             + self.CALORIES_MEAN_SPEED_SHIFT) * self.weight / self.M_IN_KM
-            * self.duration * self.MINS_IN_HOUR
-        )
+        return self._spent_calories(self.get_mean_speed())
 
+    def _spent_calories(self, mean_speed: float) -> float:
+        return _run_cal(mean_speed, self.duration, self.weight)
 
-@dataclass
+
+@dataclass(eq=False, repr=False)
 class SportsWalking(Training):
     """Тренировка: спортивная ходьба."""
     height: int
@@ -85,17 +170,13 @@ class SportsWalking(Training):
     SM_IN_METR: ClassVar[int] = 100
 
     def get_spent_calories(self) -> float:
-        mean_speed_ms: float = self.get_mean_speed() * self.COEF_KMH_TO_MS
-        height_m: float = self.height / self.SM_IN_METR
+        return self._spent_calories(self.get_mean_speed())
 
-        return (
-            (self.CALORIES_WEIGHT_MULTIPLIER * self.weight
-             + (mean_speed_ms**2 / height_m) * self.CALORIES_SPEED_MULTIPLIER
-             * self.weight) * self.duration * self.MINS_IN_HOUR
-        )
+    def _spent_calories(self, mean_speed: float) -> float:
+        return _walk_cal(mean_speed, self.duration, self.weight, self.height)
 
 
-@dataclass
+@dataclass(eq=False, repr=False)
 class Swimming(Training):
     """Тренировка: плавание."""
     length_pool: int
@@ -111,28 +192,225 @@ class Swimming(Training):
         )
 
     def get_spent_calories(self) -> float:
-        return (
-            (self.get_mean_speed() + self.CALORIES_MEAN_SPEED_SHIFT)
-            * self.CALORIES_MEAN_SPEED_MULTIPLIER * self.weight * self.duration
+        return self._spent_calories(self.get_mean_speed())
+
+    def _spent_calories(self, mean_speed: float) -> float:
+        return _swim_cal(mean_speed, self.duration, self.weight)
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _run_cal_batch(
+    action: np.ndarray,
+    duration: np.ndarray,
+    weight: np.ndarray,
+    out: np.ndarray
+) -> None:
+    """Параллельное ядро калорий бега по колонкам пакетов."""
+    for row in prange(duration.shape[0]):
+        mean_speed = action[row] * 0.65 / 1000.0 / duration[row]
+        out[row] = (
+            (18.0 * mean_speed + 1.79)
+            * weight[row] * duration[row] * _RUN_DURATION_FACTOR
         )
 
 
-def read_package(workout_type: str, data: List[int]) -> Training:
+@njit(parallel=True, fastmath=True, cache=True)
+def _walk_cal_batch(
+    action: np.ndarray,
+    duration: np.ndarray,
+    weight: np.ndarray,
+    height: np.ndarray,
+    out: np.ndarray
+) -> None:
+    """Параллельное ядро калорий спортивной ходьбы по колонкам."""
+    for row in prange(duration.shape[0]):
+        mean_speed = action[row] * 0.65 / 1000.0 / duration[row]
+        out[row] = (
+            (0.035 * weight[row]
+             + mean_speed**2 * _WALK_SPEED_HEIGHT_FACTOR / height[row]
+             * weight[row])
+            * duration[row] * 60.0
+        )
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _swim_cal_batch(
+    duration: np.ndarray,
+    weight: np.ndarray,
+    length_pool: np.ndarray,
+    count_pool: np.ndarray,
+    out: np.ndarray
+) -> None:
+    """Параллельное ядро калорий плавания по колонкам."""
+    for row in prange(duration.shape[0]):
+        mean_speed = (
+            length_pool[row] * count_pool[row] / 1000.0 / duration[row]
+        )
+        out[row] = (mean_speed + 1.1) * 2.0 * weight[row] * duration[row]
+
+
+def compute_running(
+    action: np.ndarray,
+    duration: np.ndarray,
+    weight: np.ndarray
+) -> np.ndarray:
+    """Калории для колонок беговых пакетов."""
+    calories = np.empty_like(duration)
+    _run_cal_batch(action, duration, weight, calories)
+    return calories
+
+
+def compute_walking(
+    action: np.ndarray,
+    duration: np.ndarray,
+    weight: np.ndarray,
+    height: np.ndarray
+) -> np.ndarray:
+    """Калории для колонок пакетов спортивной ходьбы."""
+    calories = np.empty_like(duration)
+    _walk_cal_batch(action, duration, weight, height, calories)
+    return calories
+
+
+def compute_swimming(
+    action: np.ndarray,
+    duration: np.ndarray,
+    weight: np.ndarray,
+    length_pool: np.ndarray,
+    count_pool: np.ndarray
+) -> np.ndarray:
+    """Калории для колонок плавательных пакетов."""
+    calories = np.empty_like(duration)
+    _swim_cal_batch(duration, weight, length_pool, count_pool, calories)
+    return calories
+
+
+def _running_stats(
+    columns: tuple[np.ndarray, ...]
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Длительности, дистанции, скорости и калории для колонок бега."""
+    action, duration, weight = columns
+    distance = action * Running.LEN_STEP / Training.M_IN_KM
+    mean_speed = distance / duration
+    return duration, distance, mean_speed, compute_running(*columns)
+
+
+def _walking_stats(
+    columns: tuple[np.ndarray, ...]
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Длительности, дистанции, скорости и калории для колонок ходьбы."""
+    action, duration = columns[0], columns[1]
+    distance = action * SportsWalking.LEN_STEP / Training.M_IN_KM
+    mean_speed = distance / duration
+    return duration, distance, mean_speed, compute_walking(*columns)
+
+
+def _swimming_stats(
+    columns: tuple[np.ndarray, ...]
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Длительности, дистанции, скорости и калории для колонок плавания."""
+    action, duration = columns[0], columns[1]
+    length_pool, count_pool = columns[3], columns[4]
+    distance = action * Swimming.LEN_STEP / Training.M_IN_KM
+    mean_speed = length_pool * count_pool / Training.M_IN_KM / duration
+    return duration, distance, mean_speed, compute_swimming(*columns)
+
+
+def _format_messages(
+    training_type: str,
+    durations: np.ndarray,
+    distances: np.ndarray,
+    speeds: np.ndarray,
+    calories: np.ndarray
+) -> list[str]:
+    """Отформатировать сообщения для целых колонок средствами NumPy."""
+    parts = (
+        np.char.mod("%.3f", durations),
+        " ч.; Дистанция: ",
+        np.char.mod("%.3f", distances),
+        " км; Ср. скорость: ",
+        np.char.mod("%.3f", speeds),
+        " км/ч; Потрачено ккал: ",
+        np.char.mod("%.3f", calories),
+        "."
+    )
+    messages = np.char.add(
+        f"Тип тренировки: {training_type}; Длительность: ", parts[0]
+    )
+    for part in parts[1:]:
+        messages = np.char.add(messages, part)
+    return messages.tolist()
+
+
+_StatsFunction = Callable[
+    [tuple[np.ndarray, ...]],
+    tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+]
+
+_BATCH_DISPATCH: dict[str, tuple[str, _StatsFunction]] = {
+    "SWM": (Swimming.__name__, _swimming_stats),
+    "RUN": (Running.__name__, _running_stats),
+    "WLK": (SportsWalking.__name__, _walking_stats)
+}
+
+
+def main_batch(packages: list[tuple[str, list[float]]]) -> list[str]:
+    """Обработать пачку пакетов колонками, по одному проходу на тип.
+
+    Пакеты группируются по типу тренировки в массивы NumPy
+    (structure of arrays), после чего формулы считаются сразу
+    для всей колонки без создания объекта Training на пакет.
+    """
+    grouped: dict[str, list[int]] = {}
+    for index, (workout_type, _) in enumerate(packages):
+        grouped.setdefault(workout_type, []).append(index)
+
+    messages: list[str] = [""] * len(packages)
+    for workout_type, indexes in grouped.items():
+        dispatch = _BATCH_DISPATCH.get(workout_type)
+        if dispatch is None:
+            raise ValueError("Упражнение не найдено")
+        training_type, stats = dispatch
+        columns = tuple(
+            np.asarray(column, dtype=np.float64)
+            for column in zip(*(packages[index][1] for index in indexes))
+        )
+        batch_messages = _format_messages(training_type, *stats(columns))
+        for row, index in enumerate(indexes):
+            messages[index] = batch_messages[row]
+    return messages
+
+
+WORKOUT_TYPES: dict[str, type[Training]] = {
+    "SWM": Swimming,
+    "RUN": Running,
+    "WLK": SportsWalking
+}
+
+
+def read_package(workout_type: str, data: list[int]) -> Training:
     """Прочитать данные полученные от датчиков."""
-    workout_types: Dict[str, Type[Training]] = {
-        "SWM": Swimming,
-        "RUN": Running,
-        "WLK": SportsWalking
-    }
-    if workout_type not in workout_type:
+    training_class = WORKOUT_TYPES.get(workout_type)
+    if training_class is None:
         raise ValueError("Упражнение не найдено")
-    return workout_types[workout_type](*data)
+    return training_class(*data)
+
+
+def format_training(training: Training) -> str:
+    """Строка отчёта без создания промежуточного InfoMessage."""
+    mean_speed = training.get_mean_speed()
+    return _FORMAT_MESSAGE(
+        training._TYPE_NAME,
+        training.duration,
+        training.get_distance(),
+        mean_speed,
+        training._spent_calories(mean_speed)
+    )
 
 
 def main(training: Training) -> None:
     """Главная функция."""
-    info: InfoMessage = training.show_training_info()
-    print(info.get_message())
+    print(format_training(training))
 
 
 if __name__ == "__main__":
@@ -142,6 +420,4 @@ if __name__ == "__main__":
         ("WLK", [9000, 1, 75, 180]),
     ]
 
-    for workout_type, data in packages:
-        training = read_package(workout_type, data)
-        main(training)
+    sys.stdout.write("\n".join(main_batch(packages)) + "\n")
@@ -0,0 +1,45 @@
+"""Cython-ядра калорий: AOT-альтернатива Numba без прогрева JIT.
+
+Сборка: python setup.py build_ext --inplace
+"""
+cimport cython
+
+cdef double _RUN_DURATION_FACTOR = 60.0 / 1000.0
+cdef double _WALK_SPEED_HEIGHT_FACTOR = 0.278**2 * 0.029 * 100.0
+
+
+@cython.cdivision(True)
+cpdef double run_cal(
+    double mean_speed,
+    double duration,
+    double weight
+) noexcept nogil:
+    """Калории бега по заранее посчитанной средней скорости."""
+    return (
+        (18.0 * mean_speed + 1.79) * weight * duration * _RUN_DURATION_FACTOR
+    )
+
+
+@cython.cdivision(True)
+cpdef double walk_cal(
+    double mean_speed,
+    double duration,
+    double weight,
+    double height
+) noexcept nogil:
+    """Калории спортивной ходьбы."""
+    return (
+        (0.035 * weight
+         + mean_speed**2 * _WALK_SPEED_HEIGHT_FACTOR / height * weight)
+        * duration * 60.0
+    )
+
+
+@cython.cdivision(True)
+cpdef double swim_cal(
+    double mean_speed,
+    double duration,
+    double weight
+) noexcept nogil:
+    """Калории плавания."""
+    return (mean_speed + 1.1) * 2.0 * weight * duration
@@ -0,0 +1,7 @@
+from Cython.Build import cythonize
+from setuptools import setup
+
+setup(
+    name="hw_python_oop",
+    ext_modules=cythonize(["kernels.pyx"], language_level=3)
+)
@@ -0,0 +1,39 @@
+import pytest
+
+import homework
+
+
+PACKAGES = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('WLK', [9000, 1, 75, 180]),
+    ('RUN', [1206, 12, 6]),
+    ('WLK', [3000.33, 2.512, 75.8, 180.1]),
+]
+
+
+def test_main_batch_matches_single_pipeline():
+    expected = [
+        homework.read_package(workout_type, data)
+        .show_training_info().get_message()
+        for workout_type, data in PACKAGES
+    ]
+    assert homework.main_batch(PACKAGES) == expected, (
+        '`main_batch` должна возвращать те же сообщения '
+        'и в том же порядке, что и поштучная обработка пакетов.'
+    )
+
+
+@pytest.mark.parametrize('workout_type, data', PACKAGES)
+def test_format_training_matches_info_message(workout_type, data):
+    training = homework.read_package(workout_type, data)
+    expected = training.show_training_info().get_message()
+    assert homework.format_training(training) == expected, (
+        '`format_training` должна возвращать ту же строку, '
+        'что и `InfoMessage.get_message`.'
+    )
+
+
+def test_main_batch_unknown_workout_type():
+    with pytest.raises(ValueError):
+        homework.main_batch([('XXX', [1, 1, 1])])